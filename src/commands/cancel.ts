@@ -15,18 +15,21 @@ import { SESSION_FILE, STATE_FILE } from "../utils/paths";
  * @returns Resolves when cancellation is complete
  */
 export async function cancelCommand(): Promise<void> {
-	const stateFile = Bun.file(STATE_FILE);
-
-	if (!(await stateFile.exists())) {
+	// Read directly and treat ENOENT as "no loop" rather than probing with a
+	// separate exists() call first
+	let content: string;
+	try {
+		content = await Bun.file(STATE_FILE).text();
+	} catch (error) {
+		if ((error as NodeJS.ErrnoException).code !== "ENOENT") throw error;
 		log.message("No active Ralph loop found.");
 		return;
 	}
 
-	// Read and parse the existing state
+	// Parse the existing state
 	let state: LoopState;
 	let iteration: number | string = "?";
 	try {
-		const content = await stateFile.text();
 		state = stateFromJson(content);
 		iteration = state.iteration;
 	} catch {
@@ -1,24 +0,0 @@
-/**
- * @fileoverview Command exports for the Ralph Wiggum CLI.
- * Re-exports all CLI command handlers.
- * @module commands
- */
-
-export { cancelCommand } from "./cancel";
-export { initCommand } from "./init";
-export { loopCommand } from "./loop";
-export { resumeCommand } from "./resume";
-export {
-	scoutInitCommand,
-	scoutLsCommand,
-	scoutResultsCommand,
-	scoutRunCommand,
-	scoutStatusCommand,
-	scoutTailCommand,
-} from "./scout";
-export {
-	watchInitCommand,
-	watchLsCommand,
-	watchResultsCommand,
-	watchRunCommand,
-} from "./watch";
@@ -32,9 +32,11 @@ export async function initCommand(opts: InitOptions): Promise<void> {
 	const agentPath = join(KIRO_AGENTS_DIR, "ralph-wiggum.json");
 	const steeringPath = join(KIRO_STEERING_DIR, "ralph-context.md");
 
-	// Check for existing files
-	const agentExists = await Bun.file(agentPath).exists();
-	const steeringExists = await Bun.file(steeringPath).exists();
+	// Check for existing files (independent probes, issued together)
+	const [agentExists, steeringExists] = await Promise.all([
+		Bun.file(agentPath).exists(),
+		Bun.file(steeringPath).exists(),
+	]);
 
 	if (!opts.force && (agentExists || steeringExists)) {
 		log.error(pc.red("Files already exist:"));
@@ -7,7 +7,7 @@ import { log } from "@clack/prompts";
 import pc from "picocolors";
 
 import { runLoop } from "../core/loop-runner";
-import { LoopConfigSchema } from "../schemas/config";
+import { type LoopConfig, LoopConfigSchema } from "../schemas/config";
 
 /**
  * CLI options for the loop command (raw string values from commander).
@@ -21,20 +21,49 @@ interface LoopOptions {
 	completionPromise: string;
 	/** Optional agent name override */
 	agent?: string;
+	/** Optional path to a file with one task prompt per line */
+	batch?: string;
 }
 
 /**
  * Starts a Ralph Wiggum iterative loop.
  * Parses and validates CLI options with Zod, then delegates to runLoop().
- * @param prompt - The task prompt for the loop
+ * With `--batch`, runs one loop per prompt in the file instead.
+ * @param prompt - The task prompt for the loop (omitted with `--batch`)
  * @param opts - Command options from CLI
  * @returns Resolves when the loop completes or is interrupted
  * @throws Exits process with code 1 if validation fails
  */
 export async function loopCommand(
-	prompt: string,
+	prompt: string | undefined,
 	opts: LoopOptions,
 ): Promise<void> {
+	if (opts.batch) {
+		if (prompt) {
+			log.error(pc.red("Pass either a prompt or --batch, not both."));
+			process.exit(1);
+		}
+		const interrupted = await runBatch(opts.batch, opts);
+		process.exit(interrupted ? 1 : 0);
+	}
+
+	if (!prompt) {
+		log.error(pc.red("Missing prompt. Pass a task prompt or --batch <file>."));
+		process.exit(1);
+	}
+
+	const loopResult = await runLoop(parseLoopConfig(prompt, opts));
+	process.exit(loopResult.reason === "interrupted" ? 1 : 0);
+}
+
+/**
+ * Validates CLI options for a single prompt into a LoopConfig.
+ * @param prompt - The task prompt for the loop
+ * @param opts - Command options from CLI
+ * @returns The validated loop configuration
+ * @throws Exits process with code 1 if validation fails
+ */
+function parseLoopConfig(prompt: string, opts: LoopOptions): LoopConfig {
 	// Parse and validate options with Zod
 	const result = LoopConfigSchema.safeParse({
 		prompt,
@@ -53,6 +82,59 @@ export async function loopCommand(
 		process.exit(1);
 	}
 
-	const loopResult = await runLoop(result.data);
-	process.exit(loopResult.reason === "completed" ? 0 : 0);
+	return result.data;
+}
+
+/**
+ * Runs one loop per non-empty line of a prompt file, back to back in a
+ * single process. Tasks run sequentially on purpose: Kiro keys session
+ * history by cwd and the agent reads the one shared state file, so
+ * concurrent loops in the same directory would read each other's
+ * completion promises. Use `ralph scout --concurrency` for isolated
+ * parallel runs. Each task starts fresh, so only the last task's state is
+ * left behind for `ralph resume`. Ctrl+C stops the current task (saving its
+ * state) and skips the rest of the batch.
+ * @param batchPath - Path to the prompt file
+ * @param opts - Command options applied to every task
+ * @returns True if the batch was interrupted
+ * @throws Exits process with code 1 if the file is missing or empty
+ */
+async function runBatch(
+	batchPath: string,
+	opts: LoopOptions,
+): Promise<boolean> {
+	const batchFile = Bun.file(batchPath);
+	if (!(await batchFile.exists())) {
+		log.error(pc.red(`Batch file not found: ${batchPath}`));
+		process.exit(1);
+	}
+
+	const prompts = (await batchFile.text())
+		.split("\n")
+		.map((line) => line.trim())
+		.filter(Boolean);
+	if (prompts.length === 0) {
+		log.error(pc.red(`No prompts found in ${batchPath}`));
+		process.exit(1);
+	}
+
+	// Validate every task before running any of them
+	const configs = prompts.map((p) => parseLoopConfig(p, opts));
+
+	let completed = 0;
+	let interrupted = false;
+	for (const [i, config] of configs.entries()) {
+		log.info(pc.bold(`Batch task ${i + 1}/${configs.length}`));
+		log.message(pc.dim(`   ${config.prompt}`));
+		const result = await runLoop(config);
+		if (result.reason === "interrupted") {
+			interrupted = true;
+			break;
+		}
+		if (result.reason === "completed") completed++;
+	}
+
+	log.info(pc.bold("Batch Summary"));
+	log.message(`   ${pc.green(`${completed}/${configs.length} completed`)}`);
+	return interrupted;
 }
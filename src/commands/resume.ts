@@ -98,7 +98,7 @@ export async function resumeCommand(opts: ResumeOptions): Promise<void> {
 	}
 
 	const loopResult = await runLoop(result.data);
-	process.exit(loopResult.reason === "completed" ? 0 : 0);
+	process.exit(loopResult.reason === "interrupted" ? 1 : 0);
 }
 
 /**
@@ -174,6 +174,14 @@ export async function scoutRunCommand(opts: ScoutRunOptions): Promise<void> {
 			);
 		}
 	}
+
+	if (results.some((r) => r.interrupted)) {
+		const skipped = scouts.length - results.length;
+		if (skipped > 0) {
+			log.message(pc.dim(`   ${skipped} scout(s) not started`));
+		}
+		process.exit(1);
+	}
 }
 
 interface ScoutRunContext {
@@ -186,28 +194,35 @@ interface ScoutRunResult {
 	name: string;
 	ok: boolean;
 	error?: string;
+	/** True when the scout stopped on Ctrl+C rather than finishing */
+	interrupted?: boolean;
 }
 
 /**
  * Drain a list of scouts into N parallel workers. Each worker pulls the next
  * available scout off a shared queue and runs it to completion before pulling
  * the next one. Errors are caught per-scout so one failure never aborts the
- * fleet.
+ * fleet, but an interrupted scout (Ctrl+C) stops every worker from pulling
+ * more: each new scout would otherwise install a fresh SIGINT handler and
+ * swallow the next Ctrl+C too. Scouts left in the queue get no result.
+ * Exported for testing; `run` defaults to {@link runWatch}.
  */
-async function runScoutsWithConcurrency(
+export async function runScoutsWithConcurrency(
 	scouts: ScoutInfo[],
 	concurrency: number,
 	ctx: ScoutRunContext,
+	run: typeof runWatch = runWatch,
 ): Promise<ScoutRunResult[]> {
 	const queue = [...scouts];
 	const results: ScoutRunResult[] = [];
 	const workers: Promise<void>[] = [];
 	const workerCount = Math.min(concurrency, scouts.length);
+	let interrupted = false;
 
 	for (let i = 0; i < workerCount; i++) {
 		workers.push(
 			(async () => {
-				while (queue.length > 0) {
+				while (!interrupted && queue.length > 0) {
 					const scout = queue.shift();
 					if (!scout) break;
 
@@ -216,14 +231,24 @@ async function runScoutsWithConcurrency(
 					log.message(pc.dim(`   Watching: ${scout.watchCount} repos`));
 
 					try {
-						await runWatch({
+						const result = await run({
 							minIterations: ctx.minIterations,
 							maxIterations: ctx.maxIterations,
 							agentName: ctx.agentName,
 							manifestPath: scout.manifestPath,
 							scoutName: scout.name,
 						});
-						results.push({ name: scout.name, ok: true });
+						if (result.reason === "interrupted") {
+							interrupted = true;
+							results.push({
+								name: scout.name,
+								ok: false,
+								error: "Interrupted",
+								interrupted: true,
+							});
+						} else {
+							results.push({ name: scout.name, ok: true });
+						}
 					} catch (error) {
 						const msg = error instanceof Error ? error.message : String(error);
 						log.error(pc.red(`Scout [${scout.name}] failed: ${msg}`));
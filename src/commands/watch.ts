@@ -59,13 +59,16 @@ export async function watchRunCommand(opts: WatchRunOptions): Promise<void> {
 		process.exit(1);
 	}
 
-	await runWatch({
+	const result = await runWatch({
 		minIterations,
 		maxIterations,
 		agentName: opts.agent ?? null,
 		manifestPath: opts.manifest ?? null,
 		scoutName: opts.scout ?? null,
 	});
+	if (result.reason === "interrupted") {
+		process.exit(1);
+	}
 }
 
 /**
@@ -118,8 +121,9 @@ export async function watchInitCommand(opts: WatchInitOptions): Promise<void> {
 	if (!(await Bun.file(mcpTargetPath).exists())) {
 		const mcpSource = Bun.file(mcpSourcePath);
 		if (await mcpSource.exists()) {
-			const mcpContent = await mcpSource.text();
-			await Bun.write(mcpTargetPath, mcpContent);
+			// Passing the BunFile lets Bun copy in-kernel (copy_file_range /
+			// sendfile) instead of round-tripping the contents through a string
+			await Bun.write(mcpTargetPath, mcpSource);
 			log.success(`${pc.green("Created")} ${mcpTargetPath}`);
 			log.message(
 				pc.dim(
@@ -135,8 +139,7 @@ export async function watchInitCommand(opts: WatchInitOptions): Promise<void> {
 	if (!(await Bun.file(watchManifestFile()).exists())) {
 		const manifestSource = Bun.file(manifestSourcePath);
 		if (await manifestSource.exists()) {
-			const manifestContent = await manifestSource.text();
-			await Bun.write(watchManifestFile(), manifestContent);
+			await Bun.write(watchManifestFile(), manifestSource);
 			log.success(`${pc.green("Created")} ${watchManifestFile()}`);
 			log.message(pc.dim("  Edit this file to set your topics and languages"));
 		}
@@ -3,8 +3,31 @@
  * Provides a client interface for spawning kiro-cli chat sessions.
  * @module core/kiro-client
  */
+import { resolve } from "node:path";
+
 import { AGENT_CONFIG_PATH, DEFAULT_AGENT_NAME } from "../utils/paths";
 
+/**
+ * Absolute agent config paths already seen on disk. Only hits are cached:
+ * `ralph init` can create the file later in the same process, and the
+ * relative config path resolves differently if the cwd changes.
+ */
+const knownAgentConfigs = new Set<string>();
+
+/**
+ * Checks whether the default agent config exists, memoizing positive results
+ * so repeated KiroClient construction (e.g. `ralph loop --batch`) doesn't
+ * re-stat the file for every task.
+ * @returns True if the agent config file exists and is non-empty
+ */
+function agentConfigExists(): boolean {
+	const absPath = resolve(AGENT_CONFIG_PATH);
+	if (knownAgentConfigs.has(absPath)) return true;
+	if (!Bun.file(absPath).size) return false;
+	knownAgentConfigs.add(absPath);
+	return true;
+}
+
 /**
  * Per-invocation hook environment passed to kiro-cli. These env vars let the
  * scripts in `.kiro/hooks/` emit structured per-turn artifacts (spawn marker,
@@ -31,16 +54,30 @@ export interface RunChatOptions {
 	 * each scout runs with its own cwd and therefore its own `.kiro/`.
 	 */
 	cwd?: string;
+	/**
+	 * Aborting this signal sends SIGTERM to the kiro-cli subprocess so it can
+	 * flush and exit on its own terms; `runChat` then resolves normally.
+	 */
+	signal?: AbortSignal;
 }
 
 /**
  * Client for interacting with kiro-cli subprocess.
  * Wraps the kiro-cli chat command with the Ralph Wiggum agent.
+ *
+ * Every iteration deliberately spawns a fresh one-shot `--no-interactive`
+ * process rather than feeding prompts to a long-lived session: Ralph relies
+ * on each iteration starting from a clean model context, with continuity
+ * carried only by the state file and the working tree. What *can* be
+ * amortized across iterations — the fixed argv prefix — is built once here.
  */
 export class KiroClient {
 	/** The agent name to use for kiro-cli */
 	private agentName: string;
 
+	/** Iteration-invariant kiro-cli argv; the prompt is appended per call */
+	private readonly baseArgs: readonly string[];
+
 	/**
 	 * Creates a new KiroClient instance.
 	 * @param agentName - Optional agent name override. If not provided, uses the default Ralph Wiggum agent.
@@ -48,6 +85,14 @@ export class KiroClient {
 	 */
 	constructor(agentName?: string | null) {
 		this.agentName = agentName ?? this.getDefaultAgentName();
+		this.baseArgs = [
+			"kiro-cli",
+			"chat",
+			"--agent",
+			this.agentName,
+			"--no-interactive",
+			"--trust-all-tools",
+		];
 	}
 
 	/**
@@ -56,8 +101,7 @@ export class KiroClient {
 	 * @throws {Error} If the agent config file doesn't exist
 	 */
 	private getDefaultAgentName(): string {
-		const configFile = Bun.file(AGENT_CONFIG_PATH);
-		if (!configFile.size) {
+		if (!agentConfigExists()) {
 			throw new Error(
 				`Agent config not found at ${AGENT_CONFIG_PATH}\nRun 'ralph init' first to initialize Ralph Wiggum in this project.`,
 			);
@@ -68,7 +112,8 @@ export class KiroClient {
 	/**
 	 * Run a kiro-cli chat session.
 	 * @param prompt - The prompt to send to kiro-cli
-	 * @param options - Optional per-invocation overrides (hook env, cwd).
+	 * @param options - Optional per-invocation overrides (hook env, cwd,
+	 *   abort signal).
 	 * @returns Exit code from kiro-cli
 	 */
 	async runChat(prompt: string, options?: RunChatOptions): Promise<number> {
@@ -77,19 +122,22 @@ export class KiroClient {
 		// Pass prompt as positional argument [INPUT], not via stdin
 		const proc = Bun.spawn(
 			[
-				"kiro-cli",
-				"chat",
-				"--agent",
-				this.agentName,
-				"--no-interactive",
-				"--trust-all-tools",
+				...this.baseArgs,
 				prompt, // Positional argument for the input question
 			],
 			{
-				stdout: "inherit", // Show output in real-time
+				// Show output in real-time. Kept as inherited rather than piped
+				// through a reader: kiro-cli renders for a TTY, and the loop
+				// still needs the SQLite session for <ralph-feedback>, so
+				// scraping <promise> from stdout would not save the session
+				// read (where SQLite extracts the reply; nothing is parsed in JS).
+				stdout: "inherit",
 				stderr: "inherit",
 				env,
 				...(options?.cwd ? { cwd: options.cwd } : {}),
+				...(options?.signal
+					? { signal: options.signal, killSignal: "SIGTERM" as const }
+					: {}),
 			},
 		);
 
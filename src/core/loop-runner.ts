@@ -3,21 +3,26 @@
  * Manages the iterative loop that runs kiro-cli until completion.
  * @module core/loop-runner
  */
-import { mkdir, unlink } from "node:fs/promises";
+import { mkdir, rename, unlink } from "node:fs/promises";
 import { dirname } from "node:path";
 import { log } from "@clack/prompts";
 import pc from "picocolors";
 
 import type { LoopConfig } from "../schemas/config";
 import {
-	checkCompletionPromise,
-	extractRalphFeedback,
+	createCompletionMatcher,
+	parseRalphFeedback,
 	type RalphFeedback,
 } from "../schemas/session";
 import { type LoopState, stateToJson } from "../schemas/state";
 import { STATE_FILE } from "../utils/paths";
 import { KiroClient } from "./kiro-client";
-import { getLatestSession } from "./session-reader";
+import {
+	getLatestConversationId,
+	getLatestSessionTail,
+	type SessionReadOptions,
+	type SessionTail,
+} from "./session-reader";
 
 /**
  * Result of a loop execution.
@@ -31,6 +36,70 @@ export interface LoopResult {
 	feedback?: RalphFeedback;
 }
 
+/**
+ * Upper bound on how long to keep re-reading the session after kiro-cli
+ * exits. Kiro commits the conversation before it exits, so the first read
+ * almost always succeeds; the backoff only covers a slow final write.
+ */
+const SESSION_SETTLE_MS = 500;
+
+/** First retry delay for {@link readSessionTailAfterExit}; doubles each try. */
+const SESSION_RETRY_INITIAL_MS = 25;
+
+/**
+ * Reads the latest session tail as soon as kiro-cli has exited, retrying with
+ * exponential backoff (capped at {@link SESSION_SETTLE_MS} total) only while
+ * this iteration's session isn't visible yet: either no session exists, or
+ * the latest one is still the session that was latest before kiro-cli ran.
+ * Replaces a fixed post-exit sleep that every iteration used to pay in full.
+ * Exported for testing.
+ * @param cwd - Directory the kiro-cli session is keyed by
+ * @param previousConversationId - Latest conversation id before this run
+ * @param options - Optional read options (see {@link SessionReadOptions})
+ * @returns This iteration's session tail, or null if it didn't appear within
+ *   the budget
+ */
+export async function readSessionTailAfterExit(
+	cwd: string,
+	previousConversationId: string | null,
+	options?: SessionReadOptions,
+): Promise<SessionTail | null> {
+	let waited = 0;
+	let delay = SESSION_RETRY_INITIAL_MS;
+	while (true) {
+		const tail = getLatestSessionTail(cwd, options);
+		// The previous iteration's session would replay stale feedback, or a
+		// stale <promise>, as this iteration's
+		const fresh =
+			tail && tail.conversationId !== previousConversationId ? tail : null;
+		if (fresh || waited >= SESSION_SETTLE_MS) return fresh;
+		await new Promise((resolve) => setTimeout(resolve, delay));
+		waited += delay;
+		delay = Math.min(delay * 2, SESSION_SETTLE_MS - waited);
+	}
+}
+
+/**
+ * Writes the state file atomically: the JSON goes to a sibling temp file that
+ * is then renamed over {@link STATE_FILE}, so `ralph cancel`, `ralph resume`
+ * and the agent (which loads the file as a resource) never observe a
+ * half-written state. Each write gets its own temp name, since concurrent
+ * loops in one cwd (scout fleets) would otherwise rename each other's temp
+ * file away mid-write. The caller is responsible for the parent directory.
+ * Exported for testing.
+ * @param json - Serialized loop state
+ */
+export async function writeStateFile(json: string): Promise<void> {
+	const tmpPath = `${STATE_FILE}.${process.pid}.${crypto.randomUUID()}.tmp`;
+	try {
+		await Bun.write(tmpPath, json);
+		await rename(tmpPath, STATE_FILE);
+	} catch (error) {
+		await unlink(tmpPath).catch(() => {});
+		throw error;
+	}
+}
+
 /**
  * Runs the Ralph Wiggum iterative loop.
  * Executes kiro-cli repeatedly until the completion promise is detected
@@ -54,10 +123,20 @@ export async function runLoop(config: LoopConfig): Promise<LoopResult> {
 	// Session-reader cwd must match the subprocess cwd used for kiro-cli —
 	// Kiro keys its SQLite conversation history by the chat's cwd, so reading
 	// from the runner's (repo-root) cwd would miss every scout session and
-	// make `checkCompletionPromise` silently fail. Fall back to process.cwd()
+	// make completion detection silently fail. Fall back to process.cwd()
 	// for non-scout watches, which still spawn in the repo root.
 	const cwd = config.scoutCwd ?? process.cwd();
 
+	// Everything but the iteration and feedback is fixed for this loop
+	const fixedState: Omit<LoopState, "iteration" | "previousFeedback"> = {
+		active: true,
+		minIterations: config.minIterations,
+		maxIterations: config.maxIterations,
+		completionPromise: config.completionPromise,
+		startedAt: new Date().toISOString(),
+		prompt: config.prompt,
+	};
+
 	// Cleanup function to mark state as inactive (preserves for resume)
 	const cleanup = async (
 		currentIteration?: number,
@@ -67,17 +146,13 @@ export async function runLoop(config: LoopConfig): Promise<LoopResult> {
 		if (currentIteration !== undefined && currentIteration > 0) {
 			try {
 				const state: LoopState = {
+					...fixedState,
 					active: false, // Mark as inactive
 					iteration: currentIteration,
-					minIterations: config.minIterations,
-					maxIterations: config.maxIterations,
-					completionPromise: config.completionPromise,
-					startedAt: new Date().toISOString(),
-					prompt: config.prompt,
 					previousFeedback: currentFeedback,
 				};
 				await mkdir(dirname(STATE_FILE), { recursive: true });
-				await Bun.write(STATE_FILE, stateToJson(state));
+				await writeStateFile(stateToJson(state));
 			} catch {
 				// If we can't write state, just delete it
 				await unlink(STATE_FILE).catch(() => {});
@@ -111,38 +186,41 @@ export async function runLoop(config: LoopConfig): Promise<LoopResult> {
 	let iteration = config.isResume ? config.resumeFromIteration : 0;
 	let previousFeedback: RalphFeedback | undefined;
 
-	// Handle Ctrl+C gracefully
-	process.on("SIGINT", async () => {
+	// State lives under .kiro/; create it once rather than every iteration
+	await mkdir(dirname(STATE_FILE), { recursive: true });
+
+	const isComplete = createCompletionMatcher(config.completionPromise);
+
+	// Handle Ctrl+C by flagging the loop rather than exiting from inside the
+	// handler: the flag aborts the running kiro-cli (SIGTERM, so it can flush)
+	// and the loop saves state for resume once the iteration unwinds. A second
+	// Ctrl+C exits immediately. The handler is removed when this loop returns
+	// so back-to-back loops in one process (batch runs, scout fleets) don't
+	// stack handlers.
+	const interrupt = new AbortController();
+	const onSigint = (): void => {
+		if (interrupt.signal.aborted) process.exit(1);
 		log.warn(pc.yellow(`\nInterrupted at iteration ${iteration}`));
-		log.message("Saving state for resume...");
-		await cleanup(iteration, previousFeedback);
-		log.message("Run 'ralph resume' to continue where you left off.");
-		process.exit(1);
-	});
+		interrupt.abort();
+	};
+	process.on("SIGINT", onSigint);
 
 	try {
-		while (true) {
+		while (!interrupt.signal.aborted) {
 			iteration++;
 
 			// Create/update state file
-			const state: LoopState = {
-				active: true,
-				iteration,
-				minIterations: config.minIterations,
-				maxIterations: config.maxIterations,
-				completionPromise: config.completionPromise,
-				startedAt: new Date().toISOString(),
-				prompt: config.prompt,
-				previousFeedback,
-			};
-
-			// Ensure directory exists and write state file
-			await mkdir(dirname(STATE_FILE), { recursive: true });
-			await Bun.write(STATE_FILE, stateToJson(state));
+			await writeStateFile(
+				stateToJson({ ...fixedState, iteration, previousFeedback }),
+			);
 
 			// Log iteration start
 			log.step(pc.yellow(`Iteration ${iteration}`));
 
+			// Note which session is latest now, so the read after kiro-cli
+			// exits can tell this iteration's session from the last one
+			const previousConversationId = getLatestConversationId(cwd);
+
 			// Run kiro-cli. Pass hook env vars so .kiro/hooks/*.sh can write
 			// per-turn sidecar artifacts to the run directory without parsing
 			// the hook's stdin JSON payload (shape varies across Kiro versions).
@@ -155,30 +233,35 @@ export async function runLoop(config: LoopConfig): Promise<LoopResult> {
 					scoutName: config.scoutName ?? "",
 				},
 				cwd: config.scoutCwd ?? undefined,
+				signal: interrupt.signal,
 			});
 
+			// Interrupted mid-iteration: skip the session read and save state
+			if (interrupt.signal.aborted) break;
+
 			if (exitCode !== 0) {
 				log.warn(pc.red(`Kiro exited with code ${exitCode}`));
 			}
 
-			// Small delay to ensure Kiro has fully released the database
-			// and any WAL writes have synced
-			await new Promise((resolve) => setTimeout(resolve, 500));
-
-			// Get the session to check completion and extract feedback
-			// Wrap in try-catch to handle any database/memory issues gracefully
-			let session = null;
+			// Get the last assistant response to check completion and extract
+			// feedback. Only the session tail is needed, so the full history is
+			// never schema-validated. Wrap in try-catch to handle any
+			// database/memory issues gracefully
+			let tail: SessionTail | null = null;
 			try {
-				session = getLatestSession(cwd);
+				tail = await readSessionTailAfterExit(cwd, previousConversationId);
 			} catch (err) {
 				log.warn(pc.dim(`Could not read session: ${err}`));
 			}
+			const lastText = tail?.lastAssistantText ?? null;
 
 			// Extract feedback from this iteration for the next
-			// Only if session looks valid (has history array)
-			if (session?.history && Array.isArray(session.history)) {
+			// Only if a session was found for this iteration
+			if (tail) {
 				try {
-					previousFeedback = extractRalphFeedback(session) ?? undefined;
+					previousFeedback = lastText
+						? (parseRalphFeedback(lastText) ?? undefined)
+						: undefined;
 					if (previousFeedback?.qualityScore !== undefined) {
 						log.message(
 							pc.dim(`Quality score: ${previousFeedback.qualityScore}/10`),
@@ -192,10 +275,7 @@ export async function runLoop(config: LoopConfig): Promise<LoopResult> {
 
 			// Only check for completion after minimum iterations reached
 			if (iteration >= config.minIterations) {
-				if (
-					session &&
-					checkCompletionPromise(session, config.completionPromise)
-				) {
+				if (lastText && isComplete(lastText)) {
 					log.success(pc.green(`Completed at iteration ${iteration}!`));
 					// Task completed successfully - can delete state
 					await cleanup();
@@ -226,11 +306,12 @@ export async function runLoop(config: LoopConfig): Promise<LoopResult> {
 				};
 			}
 		}
-	} catch (error) {
-		// Re-throw non-interrupt errors
-		if (error instanceof Error && !error.message.includes("SIGINT")) {
-			throw error;
-		}
+
+		log.message("Saving state for resume...");
+		await cleanup(iteration, previousFeedback);
+		log.message("Run 'ralph resume' to continue where you left off.");
+	} finally {
+		process.off("SIGINT", onSigint);
 	}
 
 	return { reason: "interrupted", iteration, feedback: previousFeedback };
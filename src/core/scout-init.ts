@@ -104,11 +104,12 @@ export async function ensureScoutKiroTree(scoutDir: string): Promise<string> {
 	// the repo-root MCP config into each scout so every scout inherits the
 	// same search stack. We copy content instead of symlinking so the
 	// per-scout tree stays self-contained (portable, cleanly deletable).
+	// Handing Bun.write the BunFile copies in-kernel, never decoding it.
 	const repoMcp = resolve(process.cwd(), KIRO_SETTINGS_DIR, "mcp.json");
 	const scoutMcp = join(kiroDir, "settings", "mcp.json");
 	const repoMcpFile = Bun.file(repoMcp);
 	if (await repoMcpFile.exists()) {
-		await Bun.write(scoutMcp, await repoMcpFile.text());
+		await Bun.write(scoutMcp, repoMcpFile);
 	}
 
 	return kiroDir;
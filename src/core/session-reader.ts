@@ -9,59 +9,289 @@ import { type KiroSession, KiroSessionSchema } from "../schemas/session";
 import { KIRO_DB_PATH } from "../utils/paths";
 
 /**
- * Retrieves the most recent session for a directory from Kiro's SQLite database.
- * @param cwd - Working directory to get session for. Defaults to process.cwd()
- * @returns The most recent KiroSession, or null if not found or on error
- * @example
- * ```typescript
- * const session = getLatestSession("/path/to/project");
- * if (session) {
- *   console.log(`Found session: ${session.conversation_id}`);
- * }
- * ```
+ * Read-only connection to Kiro's database, opened on first use and reused
+ * across loop iterations so each poll skips the open/close cycle (header
+ * parse, lock setup, cold page cache).
  */
-export function getLatestSession(cwd?: string): KiroSession | null {
-	const targetDir = resolve(cwd ?? process.cwd());
+let cachedDb: Database | null = null;
+
+/** Whether the process-exit hook that closes {@link cachedDb} is installed. */
+let exitHookInstalled = false;
+
+/**
+ * Memory-map up to 256 MiB of the database so large session blobs are read
+ * straight from the page cache instead of through read() syscalls.
+ */
+const MMAP_SIZE_BYTES = 256 * 1024 * 1024;
+
+/** Page cache size in KiB (negative `cache_size` means KiB, not pages). */
+const CACHE_SIZE_KIB = 64 * 1024;
+
+/**
+ * Applies the reader's connection settings: a larger page cache and mmap for
+ * big session blobs, plus `query_only` so that, on top of the read-only
+ * open, no statement can ever write to Kiro's database. Shared-cache and
+ * `immutable=1` opens are deliberately not used: the former is deprecated
+ * and the latter would let SQLite ignore Kiro's concurrent writes. Exported
+ * for testing.
+ * @param db - Connection to configure
+ * @returns The same connection
+ */
+export function configureReaderConnection(db: Database): Database {
+	db.run(`PRAGMA mmap_size = ${MMAP_SIZE_BYTES}`);
+	db.run(`PRAGMA cache_size = -${CACHE_SIZE_KIB}`);
+	db.run("PRAGMA query_only = ON");
+	return db;
+}
 
-	// Check if database exists
-	const dbFile = Bun.file(KIRO_DB_PATH);
-	if (!dbFile.size) {
+/**
+ * Returns the cached read-only connection, opening it on first use.
+ * @returns The shared Kiro database connection
+ * @throws {Error} If the database cannot be opened
+ */
+function getDatabase(): Database {
+	if (!cachedDb) {
+		// Use bun:sqlite Database class (more stable than Bun.SQL tagged templates)
+		const db = new Database(KIRO_DB_PATH, { readonly: true });
+		try {
+			configureReaderConnection(db);
+		} catch (error) {
+			// Not cached yet, so nothing else would ever close it
+			db.close();
+			throw error;
+		}
+		cachedDb = db;
+		if (!exitHookInstalled) {
+			process.on("exit", resetSessionReader);
+			exitHookInstalled = true;
+		}
+	}
+	return cachedDb;
+}
+
+/**
+ * Closes the cached database connection along with the statements compiled
+ * on it. Safe to call repeatedly; the next read reopens it. Used on process
+ * exit, after read errors, and by tests.
+ */
+export function resetSessionReader(): void {
+	cachedDb?.close();
+	cachedDb = null;
+}
+
+/**
+ * Session JSON as parsed from the database, before any schema validation.
+ * Only the fields the readers rely on are typed.
+ */
+interface RawSession {
+	conversation_id?: unknown;
+	history: unknown[];
+}
+
+/**
+ * The parts of the latest session the loop needs after each iteration.
+ */
+export interface SessionTail {
+	/** Unique identifier for the conversation ("" if absent) */
+	conversationId: string;
+	/** Text of the last assistant Response, or null if there is none */
+	lastAssistantText: string | null;
+}
+
+/**
+ * Reads the conversation id from unvalidated session JSON, mirroring the
+ * schema's `""` default.
+ * @param sessionJson - Parsed session JSON
+ * @returns The conversation id, or "" if absent or not a string
+ */
+function conversationIdOf(sessionJson: RawSession): string {
+	return typeof sessionJson.conversation_id === "string"
+		? sessionJson.conversation_id
+		: "";
+}
+
+/**
+ * The newest session row of a directory. Only its identity is read up front;
+ * the value, or just the reply inside it, is fetched by primary key on use.
+ */
+interface SessionEntry {
+	/** Connection the row was read from */
+	db: Database;
+	/** key column of the row (the absolute session directory) */
+	key: string;
+	/** conversation_id column of the row */
+	conversationId: string;
+}
+
+/**
+ * Options shared by the session readers.
+ */
+export interface SessionReadOptions {
+	/**
+	 * Connection to read from instead of the cached read-only connection to
+	 * Kiro's database. The caller owns it: the reader never closes it, even
+	 * after a read error. Used by tests to read a temporary database.
+	 */
+	db?: Database;
+}
+
+/**
+ * Reports a failed query and, if it ran on our own connection, drops that
+ * connection so the next poll reopens from scratch.
+ * @param db - Connection the query ran on
+ * @param error - The error thrown by the query
+ */
+function handleReadError(db: Database, error: unknown): void {
+	console.warn(`Warning: Could not read session: ${error}`);
+	if (db === cachedDb) resetSessionReader();
+}
+
+/**
+ * Looks up the newest session for a directory. Only the row's identity is
+ * read here; the value is fetched later, if at all.
+ * @param targetDir - Absolute directory the session is keyed by
+ * @param injectedDb - Caller-owned connection, if any
+ * @returns The session entry, or null if not found or on error
+ */
+function readLatestSessionEntry(
+	targetDir: string,
+	injectedDb?: Database,
+): SessionEntry | null {
+	// Check if database exists (skipped once a connection is cached)
+	if (!injectedDb && !cachedDb && !Bun.file(KIRO_DB_PATH).size) {
 		return null;
 	}
 
-	let db: Database | null = null;
+	let db: Database;
 	try {
-		// Use bun:sqlite Database class (more stable than Bun.SQL tagged templates)
-		db = new Database(KIRO_DB_PATH, { readonly: true });
+		db = injectedDb ?? getDatabase();
+	} catch (error) {
+		console.warn(`Warning: Could not read session: ${error}`);
+		return null;
+	}
 
-		// Query with prepared statement
-		const stmt = db.prepare(`
-			SELECT value FROM conversations_v2
-			WHERE key = ?
-			ORDER BY created_at DESC
-			LIMIT 1
-		`);
+	let latest: { conversation_id: string } | null;
+	try {
+		// db.query() caches the compiled statements on the connection, so
+		// repeated polls only bind and step; they are finalized on close.
+		// The newest conversation is picked by sorting key columns only, so
+		// the session blob of every older conversation is never copied into
+		// the sorter. We can't add an index: the database belongs to Kiro and
+		// is opened read-only.
+		latest = db
+			.query(`
+				SELECT conversation_id FROM conversations_v2
+				WHERE key = ?
+				ORDER BY created_at DESC
+				LIMIT 1
+			`)
+			.get(targetDir) as { conversation_id: string } | null;
+	} catch (error) {
+		handleReadError(db, error);
+		return null;
+	}
 
-		const row = stmt.get(targetDir) as { value: string } | null;
+	if (!latest) {
+		return null;
+	}
+	return { db, key: targetDir, conversationId: latest.conversation_id };
+}
 
-		if (!row) {
-			return null;
-		}
+/**
+ * Returns the text of the last non-empty assistant Response in the session's
+ * history, found by SQLite's JSON functions so the session never crosses
+ * into JS. The last turn is tried first, since after an iteration it is
+ * almost always the reply. If it isn't (e.g. it is a tool result),
+ * `json_each` walks the history backwards, still in C. Both lookups are
+ * anchored at `$.history`, so turn-shaped data elsewhere in the session is
+ * never mistaken for a reply.
+ * @param entry - Session entry from {@link readLatestSessionEntry}
+ * @returns The text, or null if the history holds none
+ * @throws {Error} If SQLite can't evaluate the session (e.g. malformed JSON)
+ */
+function lastResponseTextOf(entry: SessionEntry): string | null {
+	const lastTurn = entry.db
+		.query(`
+			SELECT json_extract(
+				value, '$.history[#-1].assistant.Response.content'
+			) AS text
+			FROM conversations_v2
+			WHERE key = ? AND conversation_id = ?
+		`)
+		.get(entry.key, entry.conversationId) as { text: unknown } | null;
+	let text = lastTurn?.text;
 
-		// Validate the value is a non-empty string
-		if (typeof row.value !== "string" || !row.value) {
-			console.warn("Warning: Session value is not a valid string");
-			return null;
-		}
+	if (typeof text !== "string" || !text) {
+		const latestReply = entry.db
+			.query(`
+				SELECT json_extract(
+					turn.value, '$.assistant.Response.content'
+				) AS text
+				FROM conversations_v2 AS c, json_each(c.value, '$.history') AS turn
+				WHERE c.key = ? AND c.conversation_id = ?
+					AND json_type(turn.value, '$.assistant.Response.content') = 'text'
+					AND text <> ''
+				ORDER BY turn.key DESC
+				LIMIT 1
+			`)
+			.get(entry.key, entry.conversationId) as { text: unknown } | null;
+		text = latestReply?.text;
+	}
 
-		// Sanity check - session JSON shouldn't be excessively large (>50MB suggests corruption)
-		if (row.value.length > 50 * 1024 * 1024) {
-			console.warn("Warning: Session data is suspiciously large, skipping");
-			return null;
-		}
+	return typeof text === "string" && text ? text : null;
+}
+
+/**
+ * Fetches an entry's raw session JSON and applies the sanity checks shared
+ * by every reader.
+ * @param entry - Session entry from {@link readLatestSessionEntry}
+ * @returns The raw session JSON, or null if missing, unusable or on error
+ */
+function sessionValueOf(entry: SessionEntry): string | null {
+	let value: unknown;
+	try {
+		// Only the winning row's value is loaded, by primary key
+		const row = entry.db
+			.query(`
+				SELECT value FROM conversations_v2
+				WHERE key = ? AND conversation_id = ?
+			`)
+			.get(entry.key, entry.conversationId) as { value: unknown } | null;
+		value = row?.value;
+	} catch (error) {
+		handleReadError(entry.db, error);
+		return null;
+	}
+
+	if (value === undefined) {
+		return null;
+	}
+
+	// Validate the value is a non-empty string
+	if (typeof value !== "string" || !value) {
+		console.warn("Warning: Session value is not a valid string");
+		return null;
+	}
 
-		// Parse JSON and validate with Zod schema
-		const sessionJson = JSON.parse(row.value);
+	// Sanity check - session JSON shouldn't be excessively large (>50MB suggests corruption)
+	if (value.length > 50 * 1024 * 1024) {
+		console.warn("Warning: Session data is suspiciously large, skipping");
+		return null;
+	}
+
+	return value;
+}
+
+/**
+ * Parses a session row's JSON value. Performs no schema validation.
+ * @param value - Raw session JSON from the database
+ * @returns The parsed session JSON, or null if malformed
+ */
+function parseSessionJson(value: string): RawSession | null {
+	try {
+		// JSON.parse is the engine's native parser; userland JSON libraries
+		// would only be slower here
+		const sessionJson = JSON.parse(value);
 
 		// Additional sanity check - must have history array
 		if (!sessionJson || !Array.isArray(sessionJson.history)) {
@@ -69,16 +299,130 @@ export function getLatestSession(cwd?: string): KiroSession | null {
 			return null;
 		}
 
-		return KiroSessionSchema.parse(sessionJson);
+		return sessionJson as RawSession;
 	} catch (error) {
 		console.warn(`Warning: Could not read session: ${error}`);
 		return null;
-	} finally {
-		// Close database connection
-		db?.close();
 	}
 }
 
+/**
+ * Fetches and parses an entry's session JSON.
+ * @param entry - Session entry from {@link readLatestSessionEntry}
+ * @returns The parsed session JSON, or null if unavailable or malformed
+ */
+function sessionJsonOf(entry: SessionEntry): RawSession | null {
+	const value = sessionValueOf(entry);
+	return value === null ? null : parseSessionJson(value);
+}
+
+/**
+ * Options for {@link getLatestSession}.
+ */
+export interface GetLatestSessionOptions extends SessionReadOptions {
+	/**
+	 * Validate the full session with Zod. Default: true. Pass false to get the
+	 * parsed JSON as-is (with `conversation_id` defaulted), skipping a walk
+	 * over every history turn; the session helpers in schemas/session.ts all
+	 * tolerate unvalidated turns.
+	 */
+	validate?: boolean;
+}
+
+/**
+ * Retrieves the most recent session for a directory from Kiro's SQLite database.
+ * @param cwd - Working directory to get session for. Defaults to process.cwd()
+ * @param options - Optional read options (see {@link GetLatestSessionOptions})
+ * @returns The most recent KiroSession, or null if not found or on error
+ * @example
+ * ```typescript
+ * const session = getLatestSession("/path/to/project");
+ * if (session) {
+ *   console.log(`Found session: ${session.conversation_id}`);
+ * }
+ * ```
+ */
+export function getLatestSession(
+	cwd?: string,
+	options?: GetLatestSessionOptions,
+): KiroSession | null {
+	const entry = readLatestSessionEntry(
+		resolve(cwd ?? process.cwd()),
+		options?.db,
+	);
+	const sessionJson = entry ? sessionJsonOf(entry) : null;
+	if (!sessionJson) {
+		return null;
+	}
+
+	if (options?.validate === false) {
+		return {
+			...sessionJson,
+			conversation_id: conversationIdOf(sessionJson),
+		} as KiroSession;
+	}
+
+	// Validate with Zod schema
+	const result = KiroSessionSchema.safeParse(sessionJson);
+	if (!result.success) {
+		console.warn(`Warning: Could not read session: ${result.error}`);
+		return null;
+	}
+	return result.data;
+}
+
+/**
+ * Retrieves only what the loop needs from the most recent session: its id
+ * and the last assistant response. Skips Zod validation of the full history,
+ * which is the bulk of the per-iteration parsing cost on long sessions.
+ * SQLite finds the reply itself (see {@link lastResponseTextOf}), so the
+ * session is never parsed in JS; a session SQLite can't read is reported
+ * and treated as unreadable.
+ * @param cwd - Working directory to get session for. Defaults to process.cwd()
+ * @param options - Optional read options (see {@link SessionReadOptions})
+ * @returns The session tail, or null if no session was found or on error
+ */
+export function getLatestSessionTail(
+	cwd?: string,
+	options?: SessionReadOptions,
+): SessionTail | null {
+	const entry = readLatestSessionEntry(
+		resolve(cwd ?? process.cwd()),
+		options?.db,
+	);
+	if (!entry) {
+		return null;
+	}
+	try {
+		return {
+			conversationId: entry.conversationId,
+			lastAssistantText: lastResponseTextOf(entry),
+		};
+	} catch (error) {
+		handleReadError(entry.db, error);
+		return null;
+	}
+}
+
+/**
+ * Returns the conversation id of the most recent session for a directory,
+ * without reading the session itself. Lets the loop tell the previous
+ * iteration's session apart from the one kiro-cli is about to write.
+ * @param cwd - Working directory to get session for. Defaults to process.cwd()
+ * @param options - Optional read options (see {@link SessionReadOptions})
+ * @returns The conversation id, or null if no session was found or on error
+ */
+export function getLatestConversationId(
+	cwd?: string,
+	options?: SessionReadOptions,
+): string | null {
+	const entry = readLatestSessionEntry(
+		resolve(cwd ?? process.cwd()),
+		options?.db,
+	);
+	return entry?.conversationId ?? null;
+}
+
 /**
  * Path to the Kiro SQLite database.
  * Re-exported for testing purposes.
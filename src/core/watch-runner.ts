@@ -16,7 +16,7 @@ import {
 	WATCH_AGENT_NAME,
 	watchManifestFile,
 } from "../utils/paths";
-import { runLoop } from "./loop-runner";
+import { type LoopResult, runLoop } from "./loop-runner";
 import { ensureScoutKiroTree } from "./scout-init";
 
 /**
@@ -114,8 +114,10 @@ async function writeStatus(
 
 /**
  * Runs a watch discovery loop.
+ * @returns The loop result; callers must check for an `"interrupted"` reason
+ *   rather than treating every return as a finished run.
  */
-export async function runWatch(opts: WatchRunOptions): Promise<void> {
+export async function runWatch(opts: WatchRunOptions): Promise<LoopResult> {
 	// Read manifest
 	const manifest = await readManifest(opts.manifestPath);
 
@@ -203,15 +205,27 @@ export async function runWatch(opts: WatchRunOptions): Promise<void> {
 		const result = await runLoop(config);
 
 		// Update status based on loop result
-		status.status = "complete";
+		if (result.reason === "interrupted") {
+			status.status = "failed";
+			status.error = "Interrupted";
+		} else {
+			status.status = "complete";
+		}
 		status.completedAt = new Date().toISOString();
 		status.currentIteration = result.iteration;
 		await writeStatus(resultsPath, status);
 
-		log.success(
-			pc.green(`Watch run ${result.reason} at iteration ${result.iteration}`),
-		);
+		if (result.reason === "interrupted") {
+			log.warn(
+				pc.yellow(`Watch run interrupted at iteration ${result.iteration}`),
+			);
+		} else {
+			log.success(
+				pc.green(`Watch run ${result.reason} at iteration ${result.iteration}`),
+			);
+		}
 		log.message(`Results: ${resultsPath}`);
+		return result;
 	} catch (error) {
 		// Update status on failure
 		status.status = "failed";
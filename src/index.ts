@@ -6,25 +6,29 @@
  */
 import { Command } from "commander";
 
-import {
-	cancelCommand,
-	initCommand,
-	loopCommand,
-	resumeCommand,
-	scoutInitCommand,
-	scoutLsCommand,
-	scoutResultsCommand,
-	scoutRunCommand,
-	scoutStatusCommand,
-	scoutTailCommand,
-	watchInitCommand,
-	watchLsCommand,
-	watchResultsCommand,
-	watchRunCommand,
-} from "./commands";
 import { setUserDir } from "./utils/paths";
 import { VERSION } from "./version";
 
+/**
+ * Defers loading a command module until its subcommand actually runs, so
+ * `ralph --help`, `ralph cancel`, etc. don't evaluate the loop runner,
+ * SQLite session reader, and Zod schemas pulled in by other commands.
+ * @param load - Dynamic import of the command module
+ * @param name - Exported handler to call with commander's action arguments
+ * @returns A commander action that imports the module on first call
+ */
+function lazyAction<M, K extends keyof M>(
+	load: () => Promise<M>,
+	name: K,
+): (...args: unknown[]) => Promise<void> {
+	return async (...args) => {
+		const handler = (await load())[name] as (
+			...args: unknown[]
+		) => Promise<void>;
+		await handler(...args);
+	};
+}
+
 const program = new Command()
 	.name("ralph")
 	.description("Ralph Wiggum iterative loop technique for Kiro CLI")
@@ -69,13 +73,13 @@ program
 	.command("init")
 	.description("Initialize Ralph Wiggum in the current project")
 	.option("-f, --force", "Overwrite existing files if they exist")
-	.action(initCommand);
+	.action(lazyAction(() => import("./commands/init"), "initCommand"));
 
 // Loop command
 program
 	.command("loop")
 	.description("Start a Ralph Wiggum iterative loop")
-	.argument("<prompt>", "Task prompt for the loop")
+	.argument("[prompt]", "Task prompt for the loop (omit with --batch)")
 	.option(
 		"-n, --min-iterations <number>",
 		"Minimum iterations before checking completion",
@@ -92,13 +96,17 @@ program
 		"COMPLETE",
 	)
 	.option("-a, --agent <name>", "Agent name (default: ralph-wiggum)")
-	.action(loopCommand);
+	.option(
+		"-b, --batch <file>",
+		"Run one loop per non-empty line of <file>, one after another",
+	)
+	.action(lazyAction(() => import("./commands/loop"), "loopCommand"));
 
 // Cancel command
 program
 	.command("cancel")
 	.description("Cancel an active Ralph loop")
-	.action(cancelCommand);
+	.action(lazyAction(() => import("./commands/cancel"), "cancelCommand"));
 
 // Resume command
 program
@@ -117,7 +125,7 @@ program
 		"Override promise phrase to signal completion",
 	)
 	.option("-a, --agent <name>", "Agent name (default: ralph-wiggum)")
-	.action(resumeCommand);
+	.action(lazyAction(() => import("./commands/resume"), "resumeCommand"));
 
 // Watch command (with subcommands)
 const watchCmd = program
@@ -132,7 +140,7 @@ const watchCmd = program
 	.option("-a, --agent <name>", "Agent name override")
 	.option("--manifest <path>", "Path to watch manifest file")
 	.option("--scout <name>", "Scout name (namespaces results)")
-	.action(watchRunCommand)
+	.action(lazyAction(() => import("./commands/watch"), "watchRunCommand"))
 	.addHelpText(
 		"after",
 		`
@@ -148,18 +156,18 @@ watchCmd
 	.command("init")
 	.description("Initialize watch configuration (agent, steering, manifest)")
 	.option("-f, --force", "Overwrite existing files")
-	.action(watchInitCommand);
+	.action(lazyAction(() => import("./commands/watch"), "watchInitCommand"));
 
 watchCmd
 	.command("results")
 	.description("Show results for a watch run")
 	.argument("[id]", "Task ID (defaults to most recent)")
-	.action(watchResultsCommand);
+	.action(lazyAction(() => import("./commands/watch"), "watchResultsCommand"));
 
 watchCmd
 	.command("ls")
 	.description("List recent watch runs")
-	.action(watchLsCommand);
+	.action(lazyAction(() => import("./commands/watch"), "watchLsCommand"));
 
 // Scout command (fleet of focused watchers).
 // The parent action runs scouts; `run` is also registered below as an
@@ -178,7 +186,7 @@ const scoutCmd = program
 		"Max scouts to run in parallel (default 1 = sequential)",
 		"1",
 	)
-	.action(scoutRunCommand)
+	.action(lazyAction(() => import("./commands/scout"), "scoutRunCommand"))
 	.addHelpText(
 		"after",
 		`
@@ -208,18 +216,18 @@ scoutCmd
 		"Max scouts to run in parallel (default 1 = sequential)",
 		"1",
 	)
-	.action(scoutRunCommand);
+	.action(lazyAction(() => import("./commands/scout"), "scoutRunCommand"));
 
 scoutCmd
 	.command("ls")
 	.description("List all available scouts")
-	.action(scoutLsCommand);
+	.action(lazyAction(() => import("./commands/scout"), "scoutLsCommand"));
 
 scoutCmd
 	.command("results")
 	.description("Show results across scouts")
 	.argument("[name]", "Scout name (defaults to all)")
-	.action(scoutResultsCommand);
+	.action(lazyAction(() => import("./commands/scout"), "scoutResultsCommand"));
 
 scoutCmd
 	.command("init")
@@ -232,12 +240,12 @@ scoutCmd
 		"--from-example <template>",
 		"Scaffold from a built-in template (e.g. 'hn-frontpage'). Copies manifest + steering",
 	)
-	.action(scoutInitCommand);
+	.action(lazyAction(() => import("./commands/scout"), "scoutInitCommand"));
 
 scoutCmd
 	.command("status")
 	.description("One-line-per-scout fleet summary of the latest run")
-	.action(scoutStatusCommand);
+	.action(lazyAction(() => import("./commands/scout"), "scoutStatusCommand"));
 
 scoutCmd
 	.command("tail")
@@ -248,6 +256,6 @@ scoutCmd
 		"Poll interval in milliseconds (default 2000)",
 		"2000",
 	)
-	.action(scoutTailCommand);
+	.action(lazyAction(() => import("./commands/scout"), "scoutTailCommand"));
 
-program.parse();
+await program.parseAsync();
@@ -71,6 +71,28 @@ export function getAssistantText(turn: HistoryTurn): string | null {
 	return null;
 }
 
+/**
+ * Gets the text content of the last assistant Response in a history array.
+ * Accepts unvalidated turns straight from `JSON.parse`, such as the history
+ * of `getLatestSession(..., { validate: false })`; turns that aren't objects
+ * are skipped. Walks backwards by index, so in the common case (the final
+ * turn holds the Response) only that one turn is ever touched.
+ * @param history - Conversation turns, validated or raw
+ * @returns The last assistant's text content, or null if not found
+ */
+export function getLastAssistantTextFromHistory(
+	history: readonly unknown[],
+): string | null {
+	for (let i = history.length - 1; i >= 0; i--) {
+		const turn = history[i];
+		if (turn && typeof turn === "object") {
+			const text = getAssistantText(turn as HistoryTurn);
+			if (typeof text === "string" && text) return text;
+		}
+	}
+	return null;
+}
+
 /**
  * Gets the text content of the last assistant Response in the session.
  * Iterates backwards through history to find the most recent response.
@@ -78,16 +100,15 @@ export function getAssistantText(turn: HistoryTurn): string | null {
  * @returns The last assistant's text content, or null if not found
  */
 export function getLastAssistantText(session: KiroSession): string | null {
-	for (let i = session.history.length - 1; i >= 0; i--) {
-		const turn = session.history[i];
-		if (turn) {
-			const text = getAssistantText(turn);
-			if (text) return text;
-		}
-	}
-	return null;
+	return getLastAssistantTextFromHistory(session.history);
 }
 
+/** Opening completion tag, lowercase for matching against lowercased text. */
+const PROMISE_OPEN_TAG = "<promise>";
+
+/** Closing completion tag, lowercase for matching against lowercased text. */
+const PROMISE_CLOSE_TAG = "</promise>";
+
 /**
  * Checks if the last assistant response contains the completion promise.
  * Matches `<promise>PHRASE</promise>` pattern (case insensitive, flexible whitespace).
@@ -105,22 +126,62 @@ export function checkCompletionPromise(
 	promise: string,
 ): boolean {
 	const text = getLastAssistantText(session);
-	if (!text) return false;
+	return text ? hasCompletionPromise(text, promise) : false;
+}
 
-	// Use hardcoded regex to find promise tags, then compare content
-	// This avoids ReDoS by not using dynamic RegExp construction
-	const promisePattern = /<promise>\s*([\s\S]*?)\s*<\/promise>/gi;
-	const matches = text.matchAll(promisePattern);
-	const normalizedPromise = promise.trim().toLowerCase();
+/**
+ * Checks if an assistant response text contains the completion promise.
+ * Text-level counterpart of {@link checkCompletionPromise}; use
+ * {@link createCompletionMatcher} when checking many texts for one phrase.
+ * @param text - Assistant response text to search
+ * @param promise - The completion phrase to look for
+ * @returns True if `<promise>PHRASE</promise>` appears in the text
+ */
+export function hasCompletionPromise(text: string, promise: string): boolean {
+	return createCompletionMatcher(promise)(text);
+}
 
-	for (const match of matches) {
-		const content = match[1];
-		if (content && content.trim().toLowerCase() === normalizedPromise) {
-			return true;
+/**
+ * Builds a reusable completion check for one promise phrase, normalizing the
+ * phrase once instead of on every call.
+ * @param promise - The completion phrase to look for
+ * @returns Function reporting whether `<promise>PHRASE</promise>` appears in
+ *   a text
+ * @example
+ * ```typescript
+ * const isComplete = createCompletionMatcher("DONE");
+ * isComplete("All good <promise>done</promise>"); // true
+ * ```
+ */
+export function createCompletionMatcher(
+	promise: string,
+): (text: string) => boolean {
+	const normalizedPromise = promise.trim().toLowerCase();
+	if (!normalizedPromise) return () => false;
+
+	// Plain substring scan over a lowercased copy: tags are matched case
+	// insensitively and the phrase is compared literally, so no RegExp is
+	// needed (and none is ever built from the phrase, which avoids ReDoS).
+	return (text) => {
+		const lowerText = text.toLowerCase();
+
+		let openIdx = lowerText.indexOf(PROMISE_OPEN_TAG);
+		while (openIdx !== -1) {
+			const contentStart = openIdx + PROMISE_OPEN_TAG.length;
+			const closeIdx = lowerText.indexOf(PROMISE_CLOSE_TAG, contentStart);
+			if (closeIdx === -1) return false;
+
+			const content = lowerText.slice(contentStart, closeIdx).trim();
+			if (content === normalizedPromise) return true;
+
+			openIdx = lowerText.indexOf(
+				PROMISE_OPEN_TAG,
+				closeIdx + PROMISE_CLOSE_TAG.length,
+			);
 		}
-	}
 
-	return false;
+		return false;
+	};
 }
 
 /**
@@ -143,18 +204,22 @@ export interface RalphFeedback {
  */
 function sanitizeText(text: string): string {
 	// Remove control characters except newline (\n, 0x0A), carriage return (\r, 0x0D), and tab (\t, 0x09)
-	// Uses character code filtering to avoid lint warnings about control chars in regex
-	return text
-		.split("")
-		.filter((char) => {
-			const code = char.charCodeAt(0);
-			// Allow tab (9), newline (10), carriage return (13), and printable chars (32+)
-			// Block: 0-8, 11-12, 14-31, 127
-			if (code === 9 || code === 10 || code === 13) return true;
-			if (code < 32 || code === 127) return false;
-			return true;
-		})
-		.join("");
+	// Uses character code filtering to avoid lint warnings about control chars in regex.
+	// Single pass that copies runs of allowed characters, instead of
+	// materializing one string per character.
+	let result = "";
+	let runStart = 0;
+	for (let i = 0; i < text.length; i++) {
+		const code = text.charCodeAt(i);
+		// Allow tab (9), newline (10), carriage return (13), and printable chars (32+)
+		// Block: 0-8, 11-12, 14-31, 127
+		if (code === 9 || code === 10 || code === 13) continue;
+		if (code < 32 || code === 127) {
+			result += text.slice(runStart, i);
+			runStart = i + 1;
+		}
+	}
+	return runStart === 0 ? text : result + text.slice(runStart);
 }
 
 /**
@@ -248,12 +313,24 @@ export function extractTagContent(
  */
 export function parseBulletList(text: string): string[] {
 	if (!text) return [];
-	return text
-		.split("\n")
-		.map((line) => line.trim())
-		.filter((line) => line.startsWith("-") || line.startsWith("*"))
-		.map((line) => line.replace(/^[-*]\s*/, "").trim())
-		.filter(Boolean);
+
+	// Walk line by line with indexOf instead of split/map/filter chains, so
+	// only the kept items are allocated
+	const items: string[] = [];
+	let lineStart = 0;
+	while (lineStart <= text.length) {
+		let lineEnd = text.indexOf("\n", lineStart);
+		if (lineEnd === -1) lineEnd = text.length;
+
+		const line = text.slice(lineStart, lineEnd).trim();
+		if (line.startsWith("-") || line.startsWith("*")) {
+			const item = line.slice(1).trim();
+			if (item) items.push(item);
+		}
+
+		lineStart = lineEnd + 1;
+	}
+	return items;
 }
 
 /**
@@ -265,8 +342,16 @@ export function extractRalphFeedback(
 	session: KiroSession,
 ): RalphFeedback | null {
 	const text = getLastAssistantText(session);
-	if (!text) return null;
+	return text ? parseRalphFeedback(text) : null;
+}
 
+/**
+ * Extracts structured feedback from an assistant response text.
+ * Text-level counterpart of {@link extractRalphFeedback}.
+ * @param text - Assistant response text containing a `<ralph-feedback>` block
+ * @returns Extracted feedback, or null if no feedback block found
+ */
+export function parseRalphFeedback(text: string): RalphFeedback | null {
 	const feedbackBlock = extractTagContent(text, "ralph-feedback");
 	if (!feedbackBlock) return null;
 
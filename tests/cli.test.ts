@@ -42,6 +42,7 @@ describe("CLI", () => {
 		expect(output).toContain("--max-iterations");
 		expect(output).toContain("--completion-promise");
 		expect(output).toContain("--agent");
+		expect(output).toContain("--batch");
 	});
 
 	test("--help shows resume command", async () => {
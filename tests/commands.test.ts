@@ -1,5 +1,5 @@
 import { afterEach, beforeEach, describe, expect, test } from "bun:test";
-import { mkdir, rm } from "node:fs/promises";
+import { chmod, mkdir, rm } from "node:fs/promises";
 import { tmpdir } from "node:os";
 import { dirname, join } from "node:path";
 import { fileURLToPath } from "node:url";
@@ -36,6 +36,20 @@ describe("init command", () => {
 		expect(await Bun.file(steeringPath).exists()).toBe(true);
 	});
 
+	test("writes the bundled agent config", async () => {
+		await Bun.spawn(["bun", "run", indexPath, "init"], {
+			cwd: testDir,
+		}).exited;
+
+		const written = await Bun.file(
+			join(testDir, ".kiro/agents/ralph-wiggum.json"),
+		).text();
+		const bundled = await Bun.file(
+			join(projectRoot, "src/data/ralph-wiggum.json"),
+		).text();
+		expect(JSON.parse(written)).toEqual(JSON.parse(bundled));
+	});
+
 	test("refuses to overwrite without --force", async () => {
 		// First init
 		await Bun.spawn(["bun", "run", indexPath, "init"], {
@@ -614,3 +628,139 @@ describe("resume command", () => {
 		// Should still work without qualityScore
 	});
 });
+
+describe("watch command", () => {
+	let testDir: string;
+
+	beforeEach(async () => {
+		testDir = join(tmpdir(), `ralph-watch-${Date.now()}`);
+		await mkdir(join(testDir, "bin"), { recursive: true });
+	});
+
+	afterEach(async () => {
+		await rm(testDir, { recursive: true, force: true });
+	});
+
+	test("exits 1 when interrupted mid-iteration", async () => {
+		// Stand-in kiro-cli that announces itself and runs until SIGTERM
+		const fakeKiro = join(testDir, "bin", "kiro-cli");
+		const startedMarker = join(testDir, "kiro-started");
+		await Bun.write(
+			fakeKiro,
+			`#!/bin/sh\ntouch "${startedMarker}"\ntrap 'exit 0' TERM\nwhile :; do sleep 0.05; done\n`,
+		);
+		await chmod(fakeKiro, 0o755);
+		const manifestPath = join(testDir, "manifest.json");
+		await Bun.write(manifestPath, JSON.stringify({ topics: ["testing"] }));
+
+		const proc = Bun.spawn(
+			["bun", "run", indexPath, "watch", "--manifest", manifestPath],
+			{
+				cwd: testDir,
+				stdout: "pipe",
+				stderr: "pipe",
+				env: {
+					...process.env,
+					PATH: `${join(testDir, "bin")}:${process.env["PATH"]}`,
+					RALPH_USER_DIR: testDir,
+				},
+			},
+		);
+
+		try {
+			const deadline = Date.now() + 10000;
+			while (!(await Bun.file(startedMarker).exists())) {
+				if (Date.now() > deadline) throw new Error("kiro-cli never started");
+				await Bun.sleep(25);
+			}
+
+			// Ctrl+C: runLoop SIGTERMs kiro-cli, saves state and reports the
+			// interrupt instead of finishing the run as a success
+			proc.kill("SIGINT");
+			const output = await new Response(proc.stdout).text();
+			const exitCode = await proc.exited;
+
+			expect(output).toContain("Watch run interrupted");
+			expect(exitCode).toBe(1);
+		} finally {
+			proc.kill(9);
+			await proc.exited;
+		}
+	}, 20000);
+});
+
+describe("loop command --batch", () => {
+	let testDir: string;
+
+	beforeEach(async () => {
+		testDir = join(tmpdir(), `ralph-batch-${Date.now()}`);
+		await mkdir(testDir, { recursive: true });
+	});
+
+	afterEach(async () => {
+		await rm(testDir, { recursive: true, force: true });
+	});
+
+	/** Runs `ralph loop` in the test dir; returns stdout+stderr and exit code. */
+	async function runLoopCli(
+		...args: string[]
+	): Promise<{ output: string; exitCode: number }> {
+		const proc = Bun.spawn(["bun", "run", indexPath, "loop", ...args], {
+			cwd: testDir,
+			stdout: "pipe",
+			stderr: "pipe",
+		});
+		const output = await new Response(proc.stdout).text();
+		const stderr = await new Response(proc.stderr).text();
+		const exitCode = await proc.exited;
+		return { output: output + stderr, exitCode };
+	}
+
+	test("exits 1 when the batch file is missing", async () => {
+		const { output, exitCode } = await runLoopCli("--batch", "missing.txt");
+
+		expect(output).toContain("Batch file not found");
+		expect(exitCode).toBe(1);
+	});
+
+	test("exits 1 when the batch file has no prompts", async () => {
+		await Bun.write(join(testDir, "tasks.txt"), "\n   \n\n");
+
+		const { output, exitCode } = await runLoopCli("--batch", "tasks.txt");
+
+		expect(output).toContain("No prompts found");
+		expect(exitCode).toBe(1);
+	});
+
+	test("rejects a prompt combined with --batch", async () => {
+		await Bun.write(join(testDir, "tasks.txt"), "First task\n");
+
+		const { output, exitCode } = await runLoopCli(
+			"Some prompt",
+			"--batch",
+			"tasks.txt",
+		);
+
+		expect(output).toContain("not both");
+		expect(output).not.toContain("Batch task");
+		expect(exitCode).toBe(1);
+	});
+
+	test("validates every task before running any", async () => {
+		await Bun.write(join(testDir, "tasks.txt"), "First task\nSecond task\n");
+
+		const { output, exitCode } = await runLoopCli(
+			"--batch",
+			"tasks.txt",
+			"-n",
+			"0",
+		);
+
+		expect(output).toContain("Validation error");
+		expect(output).not.toContain("Batch task");
+		expect(
+			await Bun.file(join(testDir, ".kiro", "ralph-loop.local.json")).exists(),
+		).toBe(false);
+		expect(exitCode).toBe(1);
+	});
+});
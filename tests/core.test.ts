@@ -1,5 +1,22 @@
-import { describe, expect, test } from "bun:test";
-import { mkdir, mkdtemp, rm, writeFile } from "node:fs/promises";
+import { Database } from "bun:sqlite";
+import {
+	afterAll,
+	afterEach,
+	beforeAll,
+	beforeEach,
+	describe,
+	expect,
+	spyOn,
+	test,
+} from "bun:test";
+import {
+	chmod,
+	mkdir,
+	mkdtemp,
+	readdir,
+	rm,
+	writeFile,
+} from "node:fs/promises";
 import { tmpdir } from "node:os";
 import { join } from "node:path";
 
@@ -69,10 +86,192 @@ describe("KiroClient", () => {
 				await rm(tempDir, { recursive: true, force: true });
 			}
 		});
+
+		test("remembers a found agent config across constructions", async () => {
+			const tempDir = await mkdtemp(join(tmpdir(), "kiro-test-"));
+			const originalCwd = process.cwd();
+
+			try {
+				process.chdir(tempDir);
+
+				const configDir = join(tempDir, ".kiro", "agents");
+				const configPath = join(configDir, "ralph-wiggum.json");
+				await mkdir(configDir, { recursive: true });
+				await writeFile(configPath, JSON.stringify({ name: "ralph-wiggum" }));
+
+				const { KiroClient } = await import("../src/core/kiro-client.ts");
+				expect(new KiroClient()).toBeDefined();
+
+				// The positive check is memoized, so a second client skips the stat
+				const file = spyOn(Bun, "file");
+				try {
+					expect(new KiroClient()).toBeDefined();
+					expect(file).not.toHaveBeenCalled();
+				} finally {
+					file.mockRestore();
+				}
+			} finally {
+				process.chdir(originalCwd);
+				await rm(tempDir, { recursive: true, force: true });
+			}
+		});
+	});
+
+	describe("runChat", () => {
+		test("sends SIGTERM to kiro-cli when the signal aborts", async () => {
+			const tempDir = await mkdtemp(join(tmpdir(), "kiro-test-"));
+			const originalPath = process.env["PATH"];
+
+			try {
+				// Stand-in kiro-cli that records SIGTERM and otherwise runs forever
+				const termMarker = join(tempDir, "got-sigterm");
+				const fakeKiro = join(tempDir, "kiro-cli");
+				await writeFile(
+					fakeKiro,
+					`#!/bin/sh\ntrap 'touch "${termMarker}"; exit 0' TERM\nwhile :; do sleep 0.05; done\n`,
+				);
+				await chmod(fakeKiro, 0o755);
+				process.env["PATH"] = `${tempDir}:${originalPath}`;
+
+				const { KiroClient } = await import("../src/core/kiro-client.ts");
+				const interrupt = new AbortController();
+				const exited = new KiroClient("custom-agent").runChat("Go", {
+					signal: interrupt.signal,
+				});
+				await Bun.sleep(200);
+				interrupt.abort();
+
+				expect(await exited).toBe(0);
+				expect(await Bun.file(termMarker).exists()).toBe(true);
+			} finally {
+				process.env["PATH"] = originalPath;
+				await rm(tempDir, { recursive: true, force: true });
+			}
+		});
 	});
 });
 
+describe("writeStateFile", () => {
+	test("concurrent writes in one cwd all land", async () => {
+		const tempDir = await mkdtemp(join(tmpdir(), "ralph-state-test-"));
+		const originalCwd = process.cwd();
+
+		try {
+			process.chdir(tempDir);
+			await mkdir(".kiro", { recursive: true });
+
+			const { writeStateFile } = await import("../src/core/loop-runner.ts");
+			const payloads = Array.from({ length: 16 }, (_, i) => `{"n":${i}}`);
+
+			// Scout fleets share a cwd; no write may lose its temp file to another
+			await Promise.all(payloads.map((json) => writeStateFile(json)));
+
+			const written = await Bun.file(".kiro/ralph-loop.local.json").text();
+			expect(payloads).toContain(written);
+			expect(await readdir(".kiro")).toEqual(["ralph-loop.local.json"]);
+		} finally {
+			process.chdir(originalCwd);
+			await rm(tempDir, { recursive: true, force: true });
+		}
+	});
+});
+
+/** A conversations_v2 row: [key, conversation_id, session, created_at]. */
+type SessionRow = [string, string, unknown, number];
+
+/**
+ * Creates an empty Kiro-shaped session database in a temp directory, with
+ * journaling and fsync turned off since the database is throwaway.
+ */
+async function createSessionDb(): Promise<{ db: Database; dir: string }> {
+	const dir = await mkdtemp(join(tmpdir(), "kiro-db-test-"));
+	const db = new Database(join(dir, "data.sqlite3"));
+	db.run("PRAGMA journal_mode = MEMORY");
+	db.run("PRAGMA synchronous = OFF");
+	db.run(`
+		CREATE TABLE conversations_v2 (
+			key TEXT NOT NULL,
+			conversation_id TEXT NOT NULL,
+			value TEXT NOT NULL,
+			created_at INTEGER NOT NULL,
+			updated_at INTEGER NOT NULL,
+			PRIMARY KEY (key, conversation_id)
+		)
+	`);
+	return { db, dir };
+}
+
+/**
+ * Inserts session rows through one prepared statement inside a single
+ * transaction.
+ */
+function seedSessions(db: Database, rows: SessionRow[]): void {
+	const insert = db.prepare(
+		"INSERT INTO conversations_v2 VALUES (?, ?, ?, ?, ?)",
+	);
+	db.transaction(() => {
+		for (const [key, id, session, createdAt] of rows) {
+			insert.run(key, id, JSON.stringify(session), createdAt, createdAt);
+		}
+	})();
+	insert.finalize();
+}
+
+/** Builds a session whose last assistant turn says `content`. */
+function sessionSaying(id: string, content: string): unknown {
+	return {
+		conversation_id: id,
+		history: [
+			{ user: { content: { Prompt: { prompt: "Go" } } } },
+			{ assistant: { Response: { message_id: "1", content } } },
+		],
+	};
+}
+
+/** Session whose last turn is a tool result rather than a Response. */
+function sessionEndingInToolResult(id: string, content: string): unknown {
+	const session = sessionSaying(id, content) as { history: unknown[] };
+	session.history.push({ user: { content: { ToolUseResults: {} } } });
+	return session;
+}
+
+/**
+ * Session without a conversation id whose history holds turns the schema
+ * rejects, ending in a reply with feedback and a completion promise.
+ */
+function sessionWithRawTurns(content: string): unknown {
+	return {
+		history: [
+			null,
+			"not a turn",
+			{ user: { content: { Prompt: { prompt: "Go" } } } },
+			{ assistant: { Response: { message_id: "1", content } } },
+		],
+	};
+}
+
+/** Session with stale turn-shaped data stored after its history. */
+function sessionWithCheckpoint(id: string, content: string): unknown {
+	const session = sessionSaying(id, content) as Record<string, unknown>;
+	session["history"] = [
+		...(session["history"] as unknown[]),
+		{ assistant: { ToolUse: { message_id: "2", content: "" } } },
+	];
+	session["checkpoint"] = {
+		history: [{ assistant: { Response: { content: "Stale" } } }],
+	};
+	return session;
+}
+
 describe("session-reader", () => {
+	afterEach(async () => {
+		// Drop the cached connection (and its compiled statements) between cases
+		const { resetSessionReader } = await import(
+			"../src/core/session-reader.ts"
+		);
+		resetSessionReader();
+	});
+
 	describe("getLatestSession", () => {
 		test("returns null when database does not exist", async () => {
 			// Import the function
@@ -99,4 +298,234 @@ describe("session-reader", () => {
 			expect(result).toBeNull();
 		});
 	});
+
+	describe("getLatestSessionTail", () => {
+		test("returns null for directory with no sessions", async () => {
+			const { getLatestSessionTail } = await import(
+				"../src/core/session-reader.ts"
+			);
+
+			// Either the DB doesn't exist or it has no matching sessions
+			const result = getLatestSessionTail(
+				"/some/random/path/that/has/no/sessions",
+			);
+
+			expect(result).toBeNull();
+		});
+	});
+
+	// Read-only cases share one database holding every scenario, keyed by
+	// directory; a directory with no rows is the "no session" case
+	describe("with a seeded database", () => {
+		let db: Database;
+		let dbDir: string;
+
+		beforeAll(async () => {
+			({ db, dir: dbDir } = await createSessionDb());
+			seedSessions(db, [
+				["/project", "old", sessionSaying("old", "First"), 1000],
+				["/project", "new", sessionSaying("new", "Second"), 2000],
+				["/done", "d", sessionSaying("d", "<promise>DONE</promise>"), 1],
+				[
+					"/tool-result-done",
+					"t",
+					sessionEndingInToolResult("t", "<promise>DONE</promise>"),
+					1,
+				],
+				[
+					"/tool-result-wip",
+					"w",
+					sessionEndingInToolResult("w", "Still working"),
+					1,
+				],
+				["/checkpoint", "c", sessionWithCheckpoint("c", "Current"), 1],
+				[
+					"/raw",
+					"r",
+					sessionWithRawTurns(
+						"<ralph-feedback><quality-assessment><score>8</score>" +
+							"</quality-assessment></ralph-feedback>" +
+							"<promise>DONE</promise>",
+					),
+					1,
+				],
+			]);
+		});
+
+		afterAll(async () => {
+			db.close();
+			await rm(dbDir, { recursive: true, force: true });
+		});
+
+		test.each<[string, string | null]>([
+			["/project", "new"],
+			["/done", "d"],
+			["/missing", null],
+		])("getLatestSession(%p) picks %p", async (dir, id) => {
+			const { getLatestSession } = await import(
+				"../src/core/session-reader.ts"
+			);
+
+			const session = getLatestSession(dir, { db });
+			expect(session?.conversation_id ?? null).toBe(id);
+		});
+
+		test("getLatestSession skips the schema with validate: false", async () => {
+			const { getLatestSession } = await import(
+				"../src/core/session-reader.ts"
+			);
+			const { checkCompletionPromise, extractRalphFeedback } = await import(
+				"../src/schemas/session.ts"
+			);
+			const warn = spyOn(console, "warn").mockImplementation(() => {});
+
+			try {
+				// The schema rejects the null and string turns
+				expect(getLatestSession("/raw", { db })).toBeNull();
+			} finally {
+				warn.mockRestore();
+			}
+
+			const session = getLatestSession("/raw", { db, validate: false });
+			expect(session?.conversation_id).toBe("");
+			expect(session?.history).toHaveLength(4);
+			expect(session?.history[0]).toBeNull();
+
+			// The session helpers tolerate the unvalidated turns
+			if (!session) throw new Error("Expected a session");
+			expect(checkCompletionPromise(session, "DONE")).toBe(true);
+			expect(extractRalphFeedback(session)?.qualityScore).toBe(8);
+		});
+
+		// The last turn is the Response, or SQLite walks the history back to
+		// one; turn-shaped data outside the history is ignored
+		test.each<[string, string, string]>([
+			["/project", "new", "Second"],
+			["/done", "d", "<promise>DONE</promise>"],
+			["/tool-result-done", "t", "<promise>DONE</promise>"],
+			["/tool-result-wip", "w", "Still working"],
+			["/checkpoint", "c", "Current"],
+		])("getLatestSessionTail(%p) reads %p", async (dir, id, text) => {
+			const { getLatestSessionTail } = await import(
+				"../src/core/session-reader.ts"
+			);
+			const parse = spyOn(JSON, "parse");
+
+			try {
+				expect(getLatestSessionTail(dir, { db })).toEqual({
+					conversationId: id,
+					lastAssistantText: text,
+				});
+				// None of it needed parsing in JS
+				expect(parse).not.toHaveBeenCalled();
+			} finally {
+				parse.mockRestore();
+			}
+		});
+
+		test.each<[string, string | null]>([
+			["/project", "new"],
+			["/missing", null],
+		])("getLatestConversationId(%p) is %p", async (dir, id) => {
+			const { getLatestConversationId } = await import(
+				"../src/core/session-reader.ts"
+			);
+
+			expect(getLatestConversationId(dir, { db })).toBe(id);
+		});
+
+		test("getLatestSessionTail is null without sessions", async () => {
+			const { getLatestSessionTail } = await import(
+				"../src/core/session-reader.ts"
+			);
+
+			expect(getLatestSessionTail("/missing", { db })).toBeNull();
+		});
+	});
+
+	// Cases that reconfigure or modify the database get their own
+	describe("with a fresh database", () => {
+		let db: Database;
+		let dbDir: string;
+
+		beforeEach(async () => {
+			({ db, dir: dbDir } = await createSessionDb());
+		});
+
+		afterEach(async () => {
+			db.close();
+			await rm(dbDir, { recursive: true, force: true });
+		});
+
+		test("configureReaderConnection sets query_only", async () => {
+			const { configureReaderConnection } = await import(
+				"../src/core/session-reader.ts"
+			);
+
+			configureReaderConnection(db);
+			expect(db.query("PRAGMA query_only").get()).toEqual({ query_only: 1 });
+			expect(() => db.run("DELETE FROM conversations_v2")).toThrow();
+		});
+
+		describe("readSessionTailAfterExit", () => {
+			test("gives up on a session that is still the previous one", async () => {
+				const { readSessionTailAfterExit } = await import(
+					"../src/core/loop-runner.ts"
+				);
+				const done = sessionSaying("prev", "<promise>DONE</promise>");
+				seedSessions(db, [["/loop", "prev", done, 1]]);
+
+				// The previous iteration's <promise> must not complete this one
+				const start = performance.now();
+				const tail = await readSessionTailAfterExit("/loop", "prev", { db });
+				expect(tail).toBeNull();
+				expect(performance.now() - start).toBeGreaterThanOrEqual(400);
+			});
+
+			test("returns a new session that appears mid-backoff", async () => {
+				const { readSessionTailAfterExit } = await import(
+					"../src/core/loop-runner.ts"
+				);
+				seedSessions(db, [["/loop", "prev", sessionSaying("prev", "Old"), 1]]);
+				setTimeout(() => {
+					const next = sessionSaying("next", "New");
+					seedSessions(db, [["/loop", "next", next, 2]]);
+				}, 60);
+
+				const tail = await readSessionTailAfterExit("/loop", "prev", { db });
+				expect(tail).toEqual({
+					conversationId: "next",
+					lastAssistantText: "New",
+				});
+			});
+
+			test("is null when no session exists", async () => {
+				const { readSessionTailAfterExit } = await import(
+					"../src/core/loop-runner.ts"
+				);
+
+				const tail = await readSessionTailAfterExit("/loop", null, { db });
+				expect(tail).toBeNull();
+			});
+		});
+
+		test("getLatestSessionTail reports a session SQLite can't read", async () => {
+			const { getLatestSessionTail } = await import(
+				"../src/core/session-reader.ts"
+			);
+			db.run(
+				"INSERT INTO conversations_v2 VALUES ('/broken', 'b', '{not json', 1, 1)",
+			);
+			const warn = spyOn(console, "warn").mockImplementation(() => {});
+
+			try {
+				expect(getLatestSessionTail("/broken", { db })).toBeNull();
+				expect(warn).toHaveBeenCalledWith(
+					expect.stringContaining("Could not read session"),
+				);
+			} finally {
+				warn.mockRestore();
+			}
+		});
+	});
 });
@@ -2,12 +2,16 @@ import { describe, expect, test } from "bun:test";
 import { LoopConfigSchema } from "../src/schemas/config.ts";
 import {
 	checkCompletionPromise,
+	createCompletionMatcher,
 	extractRalphFeedback,
 	extractTagContent,
 	getAssistantText,
 	getLastAssistantText,
+	getLastAssistantTextFromHistory,
+	hasCompletionPromise,
 	KiroSessionSchema,
 	parseBulletList,
+	parseRalphFeedback,
 } from "../src/schemas/session.ts";
 import {
 	LoopStateSchema,
@@ -251,6 +255,50 @@ describe("getLastAssistantText", () => {
 	});
 });
 
+describe("getLastAssistantTextFromHistory", () => {
+	test("reads raw, unvalidated turns", () => {
+		const history = JSON.parse(
+			JSON.stringify([
+				{ assistant: { Response: { content: "First" } } },
+				{ user: { message: "Follow up" } },
+				{ assistant: { Response: { content: "Second" } } },
+				{ assistant: { ToolUse: { name: "fs_read" } } },
+			]),
+		);
+
+		expect(getLastAssistantTextFromHistory(history)).toBe("Second");
+	});
+
+	test("skips malformed turns and non-string content", () => {
+		const history = [
+			{ assistant: { Response: { content: "Valid" } } },
+			null,
+			"not a turn",
+			{ assistant: { Response: { content: 42 } } },
+		];
+
+		expect(getLastAssistantTextFromHistory(history)).toBe("Valid");
+	});
+
+	test("returns null for empty history", () => {
+		expect(getLastAssistantTextFromHistory([])).toBeNull();
+	});
+
+	test("stops at the last turn when it holds the response", () => {
+		const untouched = {
+			get assistant(): never {
+				throw new Error("earlier turn should not be read");
+			},
+		};
+		const history = [
+			untouched,
+			{ assistant: { Response: { content: "Latest" } } },
+		];
+
+		expect(getLastAssistantTextFromHistory(history)).toBe("Latest");
+	});
+});
+
 describe("checkCompletionPromise", () => {
 	test("detects completion promise", () => {
 		const session = KiroSessionSchema.parse({
@@ -331,6 +379,41 @@ describe("checkCompletionPromise", () => {
 	});
 });
 
+describe("hasCompletionPromise", () => {
+	test("matches promise in plain text", () => {
+		const text = "Done! <promise> DONE </promise>";
+
+		expect(hasCompletionPromise(text, "done")).toBe(true);
+		expect(hasCompletionPromise(text, "OTHER")).toBe(false);
+		expect(hasCompletionPromise("no tags here", "DONE")).toBe(false);
+	});
+
+	test("checks every tag pair, not just the first", () => {
+		const text = "<promise>WIP</promise> then <PROMISE>DONE</PROMISE>";
+
+		expect(hasCompletionPromise(text, "DONE")).toBe(true);
+	});
+
+	test("ignores unterminated and empty tags", () => {
+		expect(hasCompletionPromise("<promise>DONE", "DONE")).toBe(false);
+		expect(hasCompletionPromise("<promise></promise>", " ")).toBe(false);
+	});
+});
+
+describe("createCompletionMatcher", () => {
+	test("reuses one normalized phrase across texts", () => {
+		const isComplete = createCompletionMatcher("  Task_Complete ");
+
+		expect(isComplete("<promise>TASK_COMPLETE</promise>")).toBe(true);
+		expect(isComplete("<promise>complete</promise>")).toBe(false);
+		expect(isComplete("no tags")).toBe(false);
+	});
+
+	test("never matches a blank phrase", () => {
+		expect(createCompletionMatcher(" ")("<promise> </promise>")).toBe(false);
+	});
+});
+
 describe("extractTagContent", () => {
 	test("extracts content from simple tag", () => {
 		const text = "Some text <tag>content here</tag> more text";
@@ -361,6 +444,11 @@ describe("extractTagContent", () => {
 		const text = "<tag>  content with spaces  </tag>";
 		expect(extractTagContent(text, "tag")).toBe("content with spaces");
 	});
+
+	test("strips control characters but keeps tabs and newlines", () => {
+		const text = "<tag>\u0000a\tb\u0007\r\nc\u007f</tag>";
+		expect(extractTagContent(text, "tag")).toBe("a\tb\r\nc");
+	});
 });
 
 describe("parseBulletList", () => {
@@ -551,6 +639,20 @@ describe("extractRalphFeedback", () => {
 	});
 });
 
+describe("parseRalphFeedback", () => {
+	test("extracts feedback from plain text", () => {
+		const feedback = parseRalphFeedback(
+			"<ralph-feedback><next-steps>- Ship it</next-steps></ralph-feedback>",
+		);
+
+		expect(feedback).toEqual({ nextSteps: ["Ship it"] });
+	});
+
+	test("returns null without a feedback block", () => {
+		expect(parseRalphFeedback("Just a response")).toBeNull();
+	});
+});
+
 describe("stateToJson / stateFromJson with previousFeedback", () => {
 	test("round-trips state with previousFeedback", () => {
 		const original = LoopStateSchema.parse({
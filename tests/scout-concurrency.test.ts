@@ -1,11 +1,14 @@
 import { describe, expect, test } from "bun:test";
+import { runScoutsWithConcurrency } from "../src/commands/scout.ts";
+import type { LoopResult } from "../src/core/loop-runner.ts";
+import type { WatchRunOptions } from "../src/core/watch-runner.ts";
 
 /**
  * Black-box test of the concurrency drain pattern used by
- * runScoutsWithConcurrency (src/commands/scout.ts). We can't import that
- * function directly — it's file-private — but the pattern is small enough
- * to replicate and assert here so regressions in the ordering / error
- * handling contract land as test failures rather than production surprises.
+ * runScoutsWithConcurrency (src/commands/scout.ts). The pattern is small
+ * enough to replicate and assert here so regressions in the ordering / error
+ * handling contract land as test failures rather than production surprises;
+ * the interrupt handling is tested against the real function further down.
  */
 async function drainWithConcurrency<T>(
 	items: T[],
@@ -99,3 +102,45 @@ describe("concurrency drain pattern", () => {
 		expect(out.map((x) => x.item)).toEqual(["a", "b", "c"]);
 	});
 });
+
+describe("runScoutsWithConcurrency", () => {
+	const scoutsNamed = (...names: string[]) =>
+		names.map((name) => ({
+			name,
+			manifestPath: `${name}/watch-manifest.json`,
+			topics: ["testing"],
+			languages: [],
+			watchCount: 0,
+		}));
+	const ctx = { minIterations: 1, maxIterations: 1, agentName: null };
+
+	test.each([1, 2])(
+		"stops pulling scouts once one is interrupted (concurrency=%p)",
+		async (concurrency) => {
+			const started: string[] = [];
+			const run = async (opts: WatchRunOptions): Promise<LoopResult> => {
+				started.push(opts.scoutName ?? "");
+				if (opts.scoutName === "b") {
+					return { reason: "interrupted", iteration: 1 };
+				}
+				// Still running when "b" is interrupted
+				await new Promise((r) => setTimeout(r, 30));
+				return { reason: "completed", iteration: 1 };
+			};
+
+			const results = await runScoutsWithConcurrency(
+				scoutsNamed("a", "b", "c"),
+				concurrency,
+				ctx,
+				run,
+			);
+
+			// A second Ctrl+C would otherwise be needed to stop "c"
+			expect(started).not.toContain("c");
+			expect(results).toEqual([
+				{ name: "a", ok: true },
+				{ name: "b", ok: false, error: "Interrupted", interrupted: true },
+			]);
+		},
+	);
+});